@@ -4,67 +4,62 @@ This API simulates an e-commerce service with endpoints that can be "broken"
 to demonstrate SRE Agent's incident detection and remediation capabilities.
 """
 
-from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, Request
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import BaseModel
+import array
+import asyncio
+import gzip
 import logging
+import orjson
 import os
+import queue
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
 from datetime import datetime
-import random
-import time
+from itertools import count
 
 # ============================================
 # Application Insights Configuration
 # ============================================
 APPINSIGHTS_CONNECTION_STRING = os.getenv("APPLICATIONINSIGHTS_CONNECTION_STRING", "")
 
-# Setup Azure Monitor/Application Insights tracing
-if APPINSIGHTS_CONNECTION_STRING:
-    try:
-        from opencensus.ext.azure.trace_exporter import AzureExporter
-        from opencensus.ext.azure.log_exporter import AzureLogHandler
-        from opencensus.trace.samplers import AlwaysOnSampler
-        from opencensus.trace.tracer import Tracer
-        from opencensus.trace import config_integration
-        
-        # Enable logging integration
-        config_integration.trace_integrations(['logging'])
-        
-        # Create tracer with Azure exporter
-        tracer = Tracer(
-            exporter=AzureExporter(connection_string=APPINSIGHTS_CONNECTION_STRING),
-            sampler=AlwaysOnSampler()
-        )
-        
-        # Configure logging to send to Application Insights
-        logger = logging.getLogger(__name__)
-        logger.setLevel(logging.INFO)
-        
-        # Add Azure handler for logs
-        azure_handler = AzureLogHandler(connection_string=APPINSIGHTS_CONNECTION_STRING)
-        azure_handler.setLevel(logging.INFO)
-        logger.addHandler(azure_handler)
-        
-        # Also add console handler
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(logging.INFO)
-        logger.addHandler(console_handler)
-        
-        APPINSIGHTS_ENABLED = True
-        logger.info("Application Insights integration enabled successfully!")
-        
-    except Exception as e:
-        logging.basicConfig(level=logging.INFO)
-        logger = logging.getLogger(__name__)
-        logger.warning(f"Failed to initialize Application Insights: {e}")
-        APPINSIGHTS_ENABLED = False
-        tracer = None
-else:
-    # Fallback logging when no connection string
-    logging.basicConfig(level=logging.INFO)
-    logger = logging.getLogger(__name__)
+
+def _setup_queue_logging(logger, *handlers):
+    """Attach handlers behind a QueueHandler/QueueListener pair.
+
+    Handlers write synchronously (the Azure one uploads over HTTPS), so
+    they run on the listener thread and the request path only pays a
+    queue.put per record.
+    """
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    return listener
+
+
+# Azure wiring is deferred to the startup hook below - opencensus has a
+# heavy import and spawns exporter threads immediately, so keeping it off
+# the module path makes worker boot (and dev/test runs) faster
+APPINSIGHTS_ENABLED = bool(APPINSIGHTS_CONNECTION_STRING)
+
+# Console logging is always on; the listener thread keeps handler I/O off
+# request coroutines and picks up the Azure handler at startup
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+# Batch console output: the MemoryHandler buffers up to 64 records on the
+# listener thread and flushes in one go when full or on WARNING+, cutting
+# per-record write syscalls on the console path
+_console_handler = MemoryHandler(
+    capacity=64,
+    flushLevel=logging.WARNING,
+    target=logging.StreamHandler(),
+    flushOnClose=True
+)
+_log_listener = _setup_queue_logging(logger, _console_handler)
+if not APPINSIGHTS_ENABLED:
     logger.info("Application Insights not configured - using console logging only")
-    APPINSIGHTS_ENABLED = False
-    tracer = None
 
 # ============================================
 # FastAPI App Setup
@@ -72,8 +67,32 @@ else:
 app = FastAPI(
     title="Demo E-Commerce API",
     description="Sample API for Azure SRE Agent Demo",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
+app.state.tracer = None
+app.state.capture_span = None
+# Flipped by the startup hook only once Azure wiring actually succeeds, so
+# status endpoints report telemetry as it is, not as configured
+app.state.appinsights_ready = False
+
+# JSON compresses well and wire time dominates for list payloads; the
+# lowest level keeps the CPU cost of runtime compression small
+app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=1)
+
+# Response schemas - typed models let FastAPI serialize through
+# pydantic-core's Rust fast path instead of the generic jsonable_encoder
+class ProductModel(BaseModel):
+    id: int
+    name: str
+    price: float
+    stock: int
+
+
+class ProductResponse(BaseModel):
+    success: bool = True
+    product: ProductModel
+
 
 # Simulated product database
 PRODUCTS = [
@@ -84,51 +103,236 @@ PRODUCTS = [
     {"id": 5, "name": "Smartwatch", "price": 299.99, "stock": 150},
 ]
 
-# Feature flag to simulate bugs (controlled by environment variable or toggle)
-BUG_ENABLED = os.getenv("ENABLE_BUG", "false").lower() == "true"
+# Derived views of the static catalog, computed once at import:
+# id-indexed dict turns the per-request linear scan in get_product into a
+# single hash probe, and the inventory aggregates stop get_inventory from
+# re-summing the same numbers on every call
+PRODUCTS_BY_ID = {p["id"]: p for p in PRODUCTS}
+TOTAL_STOCK = sum(p["stock"] for p in PRODUCTS)
+LOW_STOCK_ITEMS = [p for p in PRODUCTS if p["stock"] < 100]
+
+# Product list payload is static, so serialize it once at import instead of
+# re-encoding the same bytes on every request
+_PRODUCTS_JSON = orjson.dumps({
+    "success": True,
+    "count": len(PRODUCTS),
+    "products": PRODUCTS
+})
+# Compressed once at import (max level, it's free here), so gzip-capable
+# clients get the product list without any runtime compression at all
+_PRODUCTS_JSON_GZ = gzip.compress(_PRODUCTS_JSON, compresslevel=9)
+_INVENTORY_JSON = orjson.dumps({
+    "success": True,
+    "total_items": TOTAL_STOCK,
+    "low_stock_items": LOW_STOCK_ITEMS
+})
+
+# Templates for endpoints that are static except for a few runtime fields
+# (timestamp, bug flag, telemetry status) - merged and encoded per request
+# with orjson
+_ROOT_TEMPLATE = {
+    "service": "Demo E-Commerce API",
+    "status": "running",
+    "version": "1.0.0",
+}
+_HEALTH_TEMPLATE = {
+    "status": "healthy",
+}
+
+# Feature flag to simulate bugs (controlled by environment variable or
+# toggle). Stored in a one-byte array so every reader shares one stable
+# object - the check is a single element load and the demo toggles mutate
+# in place instead of rebinding a module global
+_bug_flag = array.array('b', [1 if os.getenv("ENABLE_BUG", "false").lower() == "true" else 0])
+
+# The simulated-bug check lives in a dependency rather than an if-block in
+# every handler: with bug mode off the dependency is a no-op, and
+# /demo/enable-bug swaps in the failing version via dependency_overrides
+async def _bug_check():
+    return None
+
+
+async def _bug_check_failing():
+    logger.error("CRITICAL: Simulated failure! BUG_ENABLED=true")
+    raise HTTPException(
+        status_code=500,
+        detail="Internal Server Error: simulated failure"
+    )
+
+
+if _bug_flag[0]:
+    app.dependency_overrides[_bug_check] = _bug_check_failing
+
+# Monotonic order-id sequence - cheaper than random.randint and, unlike a
+# 90k random keyspace, collision-free (count.__next__ is a C-level atomic
+# increment, safe across the event loop and threadpool). Ids carry the
+# worker pid since every pre-forked gunicorn worker starts its own count
+_order_seq = count(1)
+_ORDER_PREFIX = f"ORD-{os.getpid()}"
+
+# Response timestamps only need second resolution, so keep one cached ISO
+# string refreshed at 1 Hz instead of allocating and formatting a datetime
+# on every request
+_NOW_ISO = datetime.utcnow().isoformat()
+
+
+async def _refresh_now_iso():
+    global _NOW_ISO
+    while True:
+        _NOW_ISO = datetime.utcnow().isoformat()
+        await asyncio.sleep(1.0)
+
+
+@app.on_event("startup")
+async def _init_appinsights():
+    """Set up Azure Monitor/Application Insights tracing lazily."""
+    if not APPINSIGHTS_ENABLED:
+        return
+
+    try:
+        from opencensus.ext.azure.trace_exporter import AzureExporter
+        from opencensus.ext.azure.log_exporter import AzureLogHandler
+        from opencensus.trace.samplers import AlwaysOnSampler, ProbabilitySampler
+        from opencensus.trace.tracer import Tracer
+        from opencensus.trace import config_integration
+
+        # Enable logging integration
+        config_integration.trace_integrations(['logging'])
+
+        # Create tracer with Azure exporter. Head-sample at 1% - tracing
+        # every request costs an exporter upload per span, so the middleware
+        # force-captures 5xx/slow requests instead (tail-based sampling).
+        # Tradeoff: routine 2xx traffic is mostly invisible in traces.
+        # Large batches on a short timer keep exports off the request path
+        # instead of back-pressuring it when the default queue fills up
+        exporter = AzureExporter(
+            connection_string=APPINSIGHTS_CONNECTION_STRING,
+            max_batch_size=5000,
+            grace_period=5.0,
+            export_interval=5.0
+        )
+        app.state.tracer = Tracer(
+            exporter=exporter,
+            sampler=ProbabilitySampler(rate=0.01)
+        )
+
+        def _capture_span(name, status_code, duration):
+            # The 1% tracer made its sampling decision at construction -
+            # with a losing draw it is a NoopTracer for the whole worker
+            # lifetime - so forced captures need a fresh always-on Tracer
+            # sharing the same exporter
+            tracer = Tracer(exporter=exporter, sampler=AlwaysOnSampler())
+            with tracer.span(name=name) as span:
+                span.add_attribute("http.status_code", status_code)
+                span.add_attribute("duration_s", duration)
+
+        app.state.capture_span = _capture_span
+        app.state.appinsights_ready = True
+
+        # Add the Azure handler to the running listener so uploads happen
+        # on the listener thread like console writes
+        azure_handler = AzureLogHandler(connection_string=APPINSIGHTS_CONNECTION_STRING)
+        azure_handler.setLevel(logging.INFO)
+        _log_listener.handlers = _log_listener.handlers + (azure_handler,)
+
+        logger.info("Application Insights integration enabled successfully!")
+
+    except Exception as e:
+        logger.warning("Failed to initialize Application Insights: %s", e)
+
+
+@app.on_event("startup")
+async def _start_clock():
+    # The loop only keeps a weak reference to tasks, so hold the refresher
+    # on app.state or it can be garbage-collected mid-flight
+    app.state.clock_task = asyncio.create_task(_refresh_now_iso())
+
+
+@app.on_event("shutdown")
+async def _stop_clock():
+    app.state.clock_task.cancel()
+
+
+@app.on_event("startup")
+async def _expand_threadpool():
+    # Sync endpoints (create_order) run in anyio's threadpool; the default
+    # 40 tokens caps concurrency well below what this service sees
+    from anyio import to_thread
+    to_thread.current_default_thread_limiter().total_tokens = 200
 
 
 # ============================================
 # Middleware for Request Tracking
 # ============================================
+# With tracing disabled and INFO logs filtered there is nobody consuming
+# the middleware's output, so skip the timing/logging work entirely
+_NEEDS_MIDDLEWARE = APPINSIGHTS_ENABLED or logger.isEnabledFor(logging.INFO)
+
+
 @app.middleware("http")
-async def track_requests(request: Request, call_next):
+async def track_requests(
+    request: Request,
+    call_next,
+    # Bound at definition time so the per-request reads are LOAD_FASTs
+    # instead of global dict lookups (Starlette calls us positionally)
+    _NEEDS_MIDDLEWARE=_NEEDS_MIDDLEWARE,
+    _get_running_loop=asyncio.get_running_loop,
+    _logger=logger,
+    _INFO=logging.INFO,
+    _state=app.state,
+):
     """Middleware to track all requests for Application Insights"""
-    start_time = time.time()
-    
-    # Log incoming request
-    logger.info(f"Request started: {request.method} {request.url.path}")
-    
+    if not _NEEDS_MIDDLEWARE:
+        return await call_next(request)
+
+    # The loop's monotonic clock is cheaper than time.time() and immune to
+    # NTP adjustments mid-request
+    loop = _get_running_loop()
+    start_time = loop.time()
+
+    # One record per request: the completion log carries method, path,
+    # status and duration, so a separate "started" record would only
+    # double handler dispatch and upload volume
     try:
         response = await call_next(request)
         
         # Calculate duration
-        duration = time.time() - start_time
+        duration = loop.time() - start_time
         
+        # Tail-based capture: head sampling drops most requests, but server
+        # errors and slow requests always get a span
+        capture_span = _state.capture_span
+        if capture_span is not None and (response.status_code >= 500 or duration > 1.0):
+            capture_span(
+                f"{request.method} {request.url.path}",
+                response.status_code,
+                duration
+            )
+
         # Log request completion with status
         if response.status_code >= 500:
-            logger.error(
-                f"Request failed: {request.method} {request.url.path} "
-                f"- Status: {response.status_code} - Duration: {duration:.3f}s"
+            _logger.error(
+                "Request failed: %s %s - Status: %s - Duration: %.3fs",
+                request.method, request.url.path, response.status_code, duration
             )
         elif response.status_code >= 400:
-            logger.warning(
-                f"Request client error: {request.method} {request.url.path} "
-                f"- Status: {response.status_code} - Duration: {duration:.3f}s"
+            _logger.warning(
+                "Request client error: %s %s - Status: %s - Duration: %.3fs",
+                request.method, request.url.path, response.status_code, duration
             )
-        else:
-            logger.info(
-                f"Request completed: {request.method} {request.url.path} "
-                f"- Status: {response.status_code} - Duration: {duration:.3f}s"
+        elif _logger.isEnabledFor(_INFO):
+            _logger.info(
+                "Request completed: %s %s - Status: %s - Duration: %.3fs",
+                request.method, request.url.path, response.status_code, duration
             )
         
         return response
         
     except Exception as e:
-        duration = time.time() - start_time
-        logger.exception(
-            f"Request exception: {request.method} {request.url.path} "
-            f"- Error: {str(e)} - Duration: {duration:.3f}s"
+        duration = loop.time() - start_time
+        _logger.exception(
+            "Request exception: %s %s - Error: %s - Duration: %.3fs",
+            request.method, request.url.path, e, duration
         )
         raise
 
@@ -136,149 +340,132 @@ async def track_requests(request: Request, call_next):
 # ============================================
 # API Endpoints
 # ============================================
+# One prefix branch for all /api routes, with the response class pinned at
+# registration time instead of re-resolved per request
+router = APIRouter(prefix="/api", default_response_class=ORJSONResponse)
+
+
 @app.get("/")
 async def root():
     """Home endpoint - shows API status"""
-    return {
-        "service": "Demo E-Commerce API",
-        "status": "running",
-        "version": "1.0.0",
-        "timestamp": datetime.utcnow().isoformat(),
-        "bug_mode": BUG_ENABLED,
-        "appinsights_enabled": APPINSIGHTS_ENABLED
-    }
+    return Response(
+        content=orjson.dumps({
+            **_ROOT_TEMPLATE,
+            "timestamp": _NOW_ISO,
+            "bug_mode": bool(_bug_flag[0]),
+            "appinsights_enabled": app.state.appinsights_ready,
+        }),
+        media_type="application/json"
+    )
 
 
-@app.get("/health")
+@app.get("/health", include_in_schema=False)
 async def health_check():
     """Health check endpoint for monitoring"""
     logger.info("Health check requested")
-    return {
-        "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat(),
-        "appinsights": "connected" if APPINSIGHTS_ENABLED else "not configured"
-    }
+    return Response(
+        content=orjson.dumps({
+            **_HEALTH_TEMPLATE,
+            "timestamp": _NOW_ISO,
+            "appinsights": (
+                "connected" if app.state.appinsights_ready
+                else "error" if APPINSIGHTS_ENABLED
+                else "not configured"
+            ),
+        }),
+        media_type="application/json"
+    )
 
 
-@app.get("/api/products")
-async def get_products():
+@router.get("/products")
+async def get_products(request: Request, _: None = Depends(_bug_check)):
     """Get all products - main e-commerce endpoint"""
     logger.info("Fetching all products")
-    
+
     # Database connection validation (added in recent update)
     db_connection_status = None  # Bug: uninitialized variable
-    
+
     if not db_connection_status:
         logger.error("Database connection validation failed")
         raise HTTPException(
             status_code=500,
             detail="Internal Server Error"
         )
-    
-    # Simulate bug: 500 error when BUG_ENABLED is true
-    if BUG_ENABLED:
-        logger.error("CRITICAL: Database connection failed! BUG_ENABLED=true causing 500 error")
-        raise HTTPException(
-            status_code=500,
-            detail="Internal Server Error: Database connection failed"
+
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        return Response(
+            content=_PRODUCTS_JSON_GZ,
+            media_type="application/json",
+            headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"}
         )
-    
-    return {
-        "success": True,
-        "count": len(PRODUCTS),
-        "products": PRODUCTS
-    }
+    return Response(content=_PRODUCTS_JSON, media_type="application/json")
 
 
-@app.get("/api/products/{product_id}")
-async def get_product(product_id: int):
+@router.get("/products/{product_id}", response_model=ProductResponse)
+async def get_product(product_id: int, _: None = Depends(_bug_check)):
     """Get a specific product by ID"""
-    logger.info(f"Fetching product {product_id}")
-    
-    # Simulate bug: 500 error when BUG_ENABLED is true
-    if BUG_ENABLED:
-        logger.error(f"CRITICAL: Failed to fetch product {product_id}! BUG_ENABLED=true")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Internal Server Error: Failed to fetch product {product_id}"
-        )
-    
-    product = next((p for p in PRODUCTS if p["id"] == product_id), None)
+    logger.info("Fetching product %s", product_id)
+
+    product = PRODUCTS_BY_ID.get(product_id)
     if not product:
         raise HTTPException(status_code=404, detail="Product not found")
     
     return {"success": True, "product": product}
 
 
-@app.post("/api/orders")
-async def create_order(request: Request):
+@router.post("/orders")
+def create_order(request: Request, _: None = Depends(_bug_check)):
     """Create a new order - simulates order processing"""
     logger.info("Creating new order")
-    
-    # Simulate bug: 500 error when BUG_ENABLED is true
-    if BUG_ENABLED:
-        logger.error("CRITICAL: Order processing failed! BUG_ENABLED=true")
-        raise HTTPException(
-            status_code=500,
-            detail="Internal Server Error: Order processing failed"
-        )
-    
+
     return {
         "success": True,
-        "order_id": f"ORD-{random.randint(10000, 99999)}",
+        "order_id": f"{_ORDER_PREFIX}-{next(_order_seq):08d}",
         "status": "created",
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": _NOW_ISO
     }
 
 
-@app.get("/api/inventory")
-async def get_inventory():
+@router.get("/inventory")
+async def get_inventory(_: None = Depends(_bug_check)):
     """Get inventory status - for dependency mapping demo"""
     logger.info("Checking inventory")
-    
-    if BUG_ENABLED:
-        logger.error("CRITICAL: Inventory service unavailable! BUG_ENABLED=true")
-        raise HTTPException(
-            status_code=500,
-            detail="Internal Server Error: Inventory service unavailable"
-        )
-    
-    return {
-        "success": True,
-        "total_items": sum(p["stock"] for p in PRODUCTS),
-        "low_stock_items": [p for p in PRODUCTS if p["stock"] < 100]
-    }
+
+    return Response(content=_INVENTORY_JSON, media_type="application/json")
+
+
+app.include_router(router)
 
 
 # ============================================
 # Demo Control Endpoints
 # ============================================
-@app.post("/demo/enable-bug")
+@app.post("/demo/enable-bug", include_in_schema=False)
 async def enable_bug():
     """Enable bug mode (for demo - triggers 500 errors)"""
-    global BUG_ENABLED
-    BUG_ENABLED = True
+    _bug_flag[0] = 1
+    app.dependency_overrides[_bug_check] = _bug_check_failing
     logger.warning("⚠️ BUG MODE ENABLED - API will return 500 errors!")
     logger.error("SIMULATED BUG ACTIVATED - This is a demo error for SRE Agent testing")
     return {"message": "Bug mode enabled", "bug_enabled": True}
 
 
-@app.post("/demo/disable-bug")
+@app.post("/demo/disable-bug", include_in_schema=False)
 async def disable_bug():
     """Disable bug mode (for demo - restores normal operation)"""
-    global BUG_ENABLED
-    BUG_ENABLED = False
+    _bug_flag[0] = 0
+    app.dependency_overrides.pop(_bug_check, None)
     logger.info("✅ Bug mode disabled - API restored to normal operation")
     return {"message": "Bug mode disabled", "bug_enabled": False}
 
 
-@app.get("/demo/status")
+@app.get("/demo/status", include_in_schema=False)
 async def demo_status():
     """Check current demo status"""
     return {
-        "bug_enabled": BUG_ENABLED,
-        "appinsights_enabled": APPINSIGHTS_ENABLED,
-        "message": "API will return 500 errors" if BUG_ENABLED else "API is operating normally"
+        "bug_enabled": bool(_bug_flag[0]),
+        "appinsights_enabled": app.state.appinsights_ready,
+        "message": "API will return 500 errors" if _bug_flag[0] else "API is operating normally"
     }
 
 
@@ -289,17 +476,16 @@ async def demo_status():
 async def http_exception_handler(request: Request, exc: HTTPException):
     """Custom exception handler that logs to Application Insights"""
     logger.error(
-        f"HTTP Exception: Status={exc.status_code}, "
-        f"Detail={exc.detail}, Path={request.url.path}, "
-        f"Method={request.method}"
+        "HTTP Exception: Status=%s, Detail=%s, Path=%s, Method=%s",
+        exc.status_code, exc.detail, request.url.path, request.method
     )
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": exc.detail,
             "status_code": exc.status_code,
             "path": request.url.path,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": _NOW_ISO
         }
     )
 
@@ -308,20 +494,35 @@ async def http_exception_handler(request: Request, exc: HTTPException):
 async def general_exception_handler(request: Request, exc: Exception):
     """Catch-all exception handler for unexpected errors"""
     logger.exception(
-        f"Unhandled Exception: {type(exc).__name__}: {str(exc)}, "
-        f"Path={request.url.path}, Method={request.method}"
+        "Unhandled Exception: %s: %s, Path=%s, Method=%s",
+        type(exc).__name__, exc, request.url.path, request.method
     )
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "Internal Server Error",
             "status_code": 500,
             "path": request.url.path,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": _NOW_ISO
         }
     )
 
 
 if __name__ == "__main__":
+    if os.getenv("APP_ENV", "development") == "production":
+        # Pre-forked gunicorn managing uvicorn workers - see gunicorn_conf.py
+        os.execvp("gunicorn", ["gunicorn", "-c", "gunicorn_conf.py", "app.main:app"])
+
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # Request the uvloop event loop and httptools parser explicitly so we
+    # never silently fall back to asyncio + h11. Access log is disabled
+    # because track_requests already logs every request.
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=os.cpu_count() * 2 + 1,
+        access_log=False
+    )
@@ -0,0 +1,15 @@
+"""Gunicorn configuration for production deployments.
+
+FastAPI's event loop is single-threaded, so a lone uvicorn process can
+never use more than one core. Pre-fork one uvicorn worker per core (plus
+headroom) so multi-core hosts are fully utilized.
+"""
+
+import os
+
+bind = "0.0.0.0:8000"
+workers = 2 * (os.cpu_count() or 1) + 1
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# track_requests middleware already logs every request
+accesslog = None